@@ -8,31 +8,64 @@ import subprocess
 import os
 import sys
 
+# Resolved once at import; these do not change for the life of the process
+_PY = sys.executable or “/usr/bin/python3”
+_BASE = os.path.dirname(os.path.abspath(file))
+
+# Tools shown in the grid: (name, argv)
+_TOOLS = (
+    (“Script One”, (_PY, os.path.join(_BASE, “script_one.py”))),
+    (“Script Two”, (_PY, os.path.join(_BASE, “script_two.py”))),
+)
+
+# Derived from _TOOLS so model position and command always line up
+_TOOL_NAMES = [name for name, argv in _TOOLS]
+_COMMANDS = tuple(argv for name, argv in _TOOLS)
+
+# Grid cell: icon above name. Instantiated by GtkBuilder in one call.
+_ITEM_UI = ”””
+<interface>
+  <template class='ToolboxItem' parent='GtkBox'>
+    <property name='orientation'>vertical</property>
+    <property name='spacing'>6</property>
+    <property name='margin-top'>8</property>
+    <property name='margin-bottom'>8</property>
+    <property name='margin-start'>8</property>
+    <property name='margin-end'>8</property>
+    <child>
+      <object class='GtkLabel'>
+        <property name='label'>🧰</property>
+      </object>
+    </child>
+    <child>
+      <object class='GtkLabel' id='label'/>
+    </child>
+  </template>
+</interface>
+”””
+
+
+@Gtk.Template(string=_ITEM_UI)
+class ToolboxItem(Gtk.Box):
+    gtype_name = “ToolboxItem”
+
+    label = Gtk.Template.Child()
+
 
 class ToolboxWindow(Gtk.ApplicationWindow):
     def init(self, app):
         super().init(application=app, title=“UMRS Toolbox”)
         self.set_default_size(400, 300)
 
-        # List of tool names
-        tool_names = [“Script One”, “Script Two”]
-
-        # Map names to commands
-        python_exe = sys.executable or “/usr/bin/python3”
-        base_dir = os.path.abspath(os.path.dirname(file))
-
-        self.commands = {
-            “Script One”: [python_exe, os.path.join(base_dir, “script_one.py”)],
-            “Script Two”: [python_exe, os.path.join(base_dir, “script_two.py”)],
-        }
-
         # Model
-        model = Gtk.StringList.new(tool_names)
+        model = Gtk.StringList.new(_TOOL_NAMES)
 
         # Factory
         factory = Gtk.SignalListItemFactory()
         factory.connect(“setup”, self.on_setup)
         factory.connect(“bind”, self.on_bind)
+        factory.connect(“unbind”, self.on_unbind)
+        factory.connect(“teardown”, self.on_teardown)
 
         # GridView (GTK4 replacement for IconView)
         grid = Gtk.GridView(model=model, factory=factory)
@@ -45,32 +78,22 @@ class ToolboxWindow(Gtk.ApplicationWindow):
         self.set_child(scroller)
 
     def on_setup(self, factory, list_item):
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        box.set_margin_top(8)
-        box.set_margin_bottom(8)
-        box.set_margin_start(8)
-        box.set_margin_end(8)
-
-        icon = Gtk.Label(label=“🧰”)
-        label = Gtk.Label()
-
-        box.append(icon)
-        box.append(label)
-
-        list_item.set_child(box)
-        list_item.label = label
+        list_item.set_child(ToolboxItem())
 
     def on_bind(self, factory, list_item):
         obj = list_item.get_item()
-        list_item.label.set_text(obj.get_string())
+        list_item.get_child().label.set_text(obj.get_string())
 
-    def on_activate(self, grid, position):
-        model = grid.get_model()
-        name = model.get_item(position).get_string()
+    def on_unbind(self, factory, list_item):
+        # Cell goes back to the pool; keep the widget, drop the stale text
+        list_item.get_child().label.set_text(“”)
 
-        cmd = self.commands.get(name)
-        if cmd:
-            subprocess.Popen(cmd)
+    def on_teardown(self, factory, list_item):
+        list_item.set_child(None)
+
+    def on_activate(self, grid, position):
+        if position < len(_COMMANDS):
+            subprocess.Popen(_COMMANDS[position])
 
 
 class ToolboxApp(Gtk.Application):
@@ -1,7 +1,7 @@
 # This module is responsible for:
 #
 # • Initializing the global CSS provider (once).
-# • Attaching it to the default screen.
+# • Attaching it to the default display.
 # • Exposing small helpers like style_window() and style_primary_button().
 
 from gi.repository import Gtk, Gdk
@@ -38,7 +38,7 @@ _css_provider = None
 
 def init_umrs_theme():
     “””
-    Initialize the UMRS CSS provider and attach it to the default screen.
+    Initialize the UMRS CSS provider and attach it to the default display.
     Safe to call multiple times; it only does real work once.
     “””
     global _css_provider
@@ -46,16 +46,19 @@ def init_umrs_theme():
     if _css_provider is not None:
         return
 
+    # Before GDK has a display there is nothing to attach to; leave the
+    # provider unset so the next call retries instead of latching a no-op.
+    display = Gdk.Display.get_default()
+    if display is None:
+        return
+
     provider = Gtk.CssProvider()
     provider.load_from_data(_UMRS_CSS)
-
-    screen = Gdk.Screen.get_default()
-    if screen is not None:
-        Gtk.StyleContext.add_provider_for_screen(
-            screen,
-            provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-        )
+    Gtk.StyleContext.add_provider_for_display(
+        display,
+        provider,
+        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+    )
     _css_provider = provider
 
 def style_umrs_window(window: Gtk.Window):
@@ -63,21 +66,18 @@ def style_umrs_window(window: Gtk.Window):
     Apply the UMRS main-window style class to a window.
     “””
     init_umrs_theme()
-    ctx = window.get_style_context()
-    ctx.add_class(“umrs-main-window”)
+    window.add_css_class(“umrs-main-window”)
 
 def style_section_title(label: Gtk.Label):
     “””
     Apply the UMRS section title style to a label.
     “””
     init_umrs_theme()
-    ctx = label.get_style_context()
-    ctx.add_class(“umrs-section-title”)
+    label.add_css_class(“umrs-section-title”)
 
 def style_primary_button(button: Gtk.Button):
     “””
     Apply the UMRS primary-action style to a button.
     “””
     init_umrs_theme()
-    ctx = button.get_style_context()
-    ctx.add_class(“umrs-primary-action”)
+    button.add_css_class(“umrs-primary-action”)
@@ -25,14 +25,14 @@ class UMRSApplication(Gtk.Application):
     def _init_umrs_environment(self):
         # Example: check FIPS, SELinux, MLS, key dirs, etc.
         # Set self.umrs_env_ok accordingly and log or raise if needed.
-        self.selinux_context = self._get_selinux_context()
 
-    def _get_selinux_context(self):
+        # UMRS tools never change their own SELinux context, so read it once
+        # here and serve every later query from self.selinux_context.
         try:
             with open(”/proc/self/attr/current”, “r”, encoding=“utf-8”) as f:
-                return f.read().strip()
+                self.selinux_context = f.read().strip()
         except OSError:
-            return None
+            self.selinux_context = None
 
     def get_selinux_context(self):
         return self.selinux_context
@@ -55,67 +55,70 @@ class UMRSApplication(Gtk.Application):
         pass
 
 
-class UmrsCssManager:
-    _provider = None
-    _is_loaded = False
+_UMRS_WINDOW_CSS = b”””
+/* UMRS dark wizard theme */
 
-    @classmethod
-    def load(cls):
-        if cls._is_loaded:
-            return
+window.umrs-window {
+    background-color: #111416;
+    color: #d5e3d5;
+}
 
-        css = b”””
-        /* UMRS dark wizard theme */
+.umrs-header {
+    font-weight: bold;
+    color: #84c991;
+}
 
-        window.umrs-window {
-            background-color: #111416;
-            color: #d5e3d5;
-        }
+.umrs-accent {
+    color: #6fbf73;
+}
 
-        .umrs-header {
-            font-weight: bold;
-            color: #84c991;
-        }
+button {
+    background-color: #1a1f1a;
+    border: 1px solid #355f35;
+}
 
-        .umrs-accent {
-            color: #6fbf73;
-        }
+button:hover {
+    background-color: #223022;
+}
+”””
 
-        button {
-            background-color: #1a1f1a;
-            border: 1px solid #355f35;
-        }
+_css_provider = None
 
-        button:hover {
-            background-color: #223022;
-        }
-        “””
+def _ensure_css():
+    # One provider per process, shared by every UmrsWindow.
+    # Deferred until GDK has a display; before that there is nothing to attach to.
+    global _css_provider
 
-        provider = Gtk.CssProvider()
-        provider.load_from_data(css)
+    if _css_provider is not None:
+        return
 
-        screen = Gdk.Screen.get_default()
-        if screen is not None:
-            Gtk.StyleContext.add_provider_for_screen(
-                screen,
-                provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
+    display = Gdk.Display.get_default()
+    if display is None:
+        return
 
-        cls._provider = provider
-        cls._is_loaded = True
+    provider = Gtk.CssProvider()
+    provider.load_from_data(_UMRS_WINDOW_CSS)
+    Gtk.StyleContext.add_provider_for_display(
+        display,
+        provider,
+        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+    )
+    _css_provider = provider
+
+# Load at import when GTK is already up, so window construction skips it.
+if Gtk.is_initialized():
+    _ensure_css()
 
 
 class UmrsWindow(Gtk.ApplicationWindow):
     def init(self, app, title=None):
         super().init(application=app)
 
-        # Ensure CSS is loaded once
-        UmrsCssManager.load()
+        # No-op once the shared provider is attached
+        _ensure_css()
 
         # Apply shared UMRS window style
-        ctx = self.get_style_context()
-        ctx.add_class(“umrs-window”)
+        self.add_css_class(“umrs-window”)
 
         if title is not None:
             self.set_title(title)
@@ -130,6 +133,10 @@ class UmrsWindow(Gtk.ApplicationWindow):
         # Central place for exit handling
         return False
 
+    def _on_dialog_response(self, dialog, response_id):
+        # Dialogs are non-blocking; tear them down once answered
+        dialog.destroy()
+
     def show_error(self, message, secondary=None):
         dialog = Gtk.MessageDialog(
             transient_for=self,
@@ -140,8 +147,8 @@ class UmrsWindow(Gtk.ApplicationWindow):
         )
         if secondary:
             dialog.format_secondary_text(secondary)
-        dialog.run()
-        dialog.destroy()
+        dialog.connect(“response”, self._on_dialog_response)
+        dialog.present()
 
     def show_info(self, message, secondary=None):
         dialog = Gtk.MessageDialog(
@@ -153,5 +160,5 @@ class UmrsWindow(Gtk.ApplicationWindow):
         )
         if secondary:
             dialog.format_secondary_text(secondary)
-        dialog.run()
-        dialog.destroy()
+        dialog.connect(“response”, self._on_dialog_response)
+        dialog.present()